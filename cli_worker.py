@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Persistent CLI worker for the test harnesses.
+
+Imports the CLI once, then executes one command per line of stdin, where
+each line is a JSON-encoded argv list. Replies with one JSON-encoded
+[exit_code, output] line per command, so a test driver pays interpreter
+start-up and Click/Rich import cost exactly once for a whole batch.
+
+This is the drop-in choice for any harness that wants process isolation
+from the driver (own database handles, own Rich console state) without
+re-spawning the interpreter per command; harnesses that don't need
+isolation should invoke commands in-process with CliRunner instead.
+"""
+
+import json
+import sys
+
+from click.testing import CliRunner
+
+from cli import disaster_cli
+
+
+def main():
+    runner = CliRunner()
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        argv = json.loads(line)
+        try:
+            result = runner.invoke(disaster_cli, argv)
+            reply = [result.exit_code, result.output]
+        except Exception as e:
+            reply = [-1, str(e)]
+        sys.stdout.write(json.dumps(reply) + '\n')
+        sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
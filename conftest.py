@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the test harnesses.
+
+Session scope means the location manager (and its location database load)
+is paid once per pytest run instead of once per test.
+"""
+
+import pytest
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--smoke', action='store_true', default=False,
+        help='also run smoke-marked CLI cases (pure help/formatting output)'
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers',
+        'smoke: help/formatting-only CLI cases, skipped unless --smoke is given'
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--smoke'):
+        return
+    skip_smoke = pytest.mark.skip(reason='smoke-only case; run with --smoke')
+    for item in items:
+        if 'smoke' in item.keywords:
+            item.add_marker(skip_smoke)
+
+
+@pytest.fixture(scope='session')
+def lm():
+    """The shared LocationManager singleton."""
+    from geolocation import location_manager
+    return location_manager
+
+
+@pytest.fixture(scope='session')
+def nyc():
+    """Reference New York City coordinates used across geolocation tests."""
+    return (40.7128, -74.0060)
+
+
+@pytest.fixture(scope='session')
+def nyc_facilities_50km(lm, nyc):
+    """
+    Emergency facilities within 50 km of NYC, scanned once per run.
+
+    Tests that need the hospital/shelter slices read the matching bucket
+    instead of re-scanning the location database per facility type.
+    """
+    return lm.find_emergency_facilities(nyc[0], nyc[1], 50)
+
+
+@pytest.fixture(scope='session')
+def stats(lm):
+    """Location statistics, computed once per run instead of per test."""
+    return lm.get_location_statistics()
+
+
+@pytest.fixture(scope='session')
+def coords_soa(lm):
+    """
+    Contiguous (lats, lons) arrays projected from the Location objects.
+
+    Built once so vectorized distance tests work on cache-friendly arrays
+    instead of walking Python objects per test.
+    """
+    if not NUMPY_AVAILABLE:
+        pytest.skip('NumPy not available')
+    count = len(lm.locations)
+    lats = np.fromiter((loc.latitude for loc in lm.locations), float, count=count)
+    lons = np.fromiter((loc.longitude for loc in lm.locations), float, count=count)
+    return lats, lons
@@ -6,13 +6,30 @@ Handles SQLite database operations for incidents, resources, personnel,
 emergency contacts, and locations with comprehensive CRUD functionality.
 """
 
+import os
 import sqlite3
 import logging
+import queue
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def _encode_json(obj) -> bytes:
+    """Encode one value as JSON bytes, using orjson's C serializer if present."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, ensure_ascii=False, default=str).encode('utf-8')
+
 
 class DisasterDatabase:
     """Comprehensive database manager for disaster response data."""
@@ -27,14 +44,37 @@ class DisasterDatabase:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.logger = logging.getLogger(__name__)
+        # LRU caches for frequent by-id lookups (invalidated on update/delete)
+        self._id_cache_size = 128
+        self._resource_cache: OrderedDict = OrderedDict()
+        self._contact_cache: OrderedDict = OrderedDict()
+        # Pool of read-only connections for concurrent read-heavy workloads
+        self._read_pool: queue.Queue = queue.Queue(maxsize=4)
+        # Memoized get_database_info result, keyed by database file mtime
+        self._info_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Optional SQLite URI override (e.g. a shared in-memory database for
+        # tests); when set, every connection uses it instead of db_path
+        self.db_url = os.environ.get('DISASTER_DB_URL')
+        # Test mode trades durability for speed on throwaway databases
+        self._test_mode = bool(os.environ.get('DISASTER_TEST_MODE'))
+        self._keeper_conn: Optional[sqlite3.Connection] = None
+        if self.db_url:
+            # Hold one connection open so a shared in-memory database
+            # survives between operations
+            self._keeper_conn = sqlite3.connect(
+                self.db_url, uri=True, check_same_thread=False
+            )
         self._init_database()
     
     def _init_database(self):
         """Initialize database with all required tables."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
-                
+
+                # WAL mode lets read-only connections run concurrently with writes
+                cursor.execute('PRAGMA journal_mode=WAL')
+
                 # Create incidents table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS incidents (
@@ -150,6 +190,21 @@ class DisasterDatabase:
                     )
                 ''')
                 
+                # Maintain updated_at in the database via triggers instead of
+                # appending "updated_at = CURRENT_TIMESTAMP" to every UPDATE
+                # statement composed in Python. The WHEN guard skips rows where
+                # the caller set updated_at explicitly and prevents recursion.
+                for table in ['incidents', 'resources', 'personnel', 'emergency_contacts']:
+                    cursor.execute(f'''
+                        CREATE TRIGGER IF NOT EXISTS trg_{table}_updated_at
+                        AFTER UPDATE ON {table}
+                        FOR EACH ROW WHEN NEW.updated_at = OLD.updated_at
+                        BEGIN
+                            UPDATE {table} SET updated_at = CURRENT_TIMESTAMP
+                            WHERE id = NEW.id;
+                        END
+                    ''')
+
                 # Create indexes for better performance
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_resources_type ON resources(type)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_resources_status ON resources(status)')
@@ -166,8 +221,41 @@ class DisasterDatabase:
     
     def get_connection(self):
         """Get a database connection."""
-        return sqlite3.connect(self.db_path)
-    
+        if self.db_url:
+            conn = sqlite3.connect(self.db_url, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.db_path)
+        if self._test_mode:
+            # Skip per-transaction fsyncs and keep temp structures in RAM;
+            # journal_mode=WAL is already set persistently at init
+            conn.executescript(
+                'PRAGMA synchronous=NORMAL;'
+                'PRAGMA temp_store=MEMORY;'
+                'PRAGMA cache_size=-65536;'
+            )
+        return conn
+
+    def _acquire_read_connection(self) -> sqlite3.Connection:
+        """Get a read-only connection from the pool, creating one if empty."""
+        try:
+            return self._read_pool.get_nowait()
+        except queue.Empty:
+            if self.db_url:
+                conn = sqlite3.connect(self.db_url, uri=True, check_same_thread=False)
+            else:
+                conn = sqlite3.connect(
+                    f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
+                )
+            conn.row_factory = sqlite3.Row
+            return conn
+
+    def _release_read_connection(self, conn: sqlite3.Connection):
+        """Return a read-only connection to the pool, closing it if full."""
+        try:
+            self._read_pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
     def execute_query(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         """
         Execute a SELECT query and return results as a list of dictionaries.
@@ -180,12 +268,14 @@ class DisasterDatabase:
             List of dictionaries representing the results
         """
         try:
-            with self.get_connection() as conn:
-                conn.row_factory = sqlite3.Row
+            conn = self._acquire_read_connection()
+            try:
                 cursor = conn.cursor()
                 cursor.execute(query, params)
                 results = cursor.fetchall()
                 return [dict(row) for row in results]
+            finally:
+                self._release_read_connection(conn)
         except sqlite3.Error as e:
             self.logger.error(f"Query execution failed: {e}")
             return []
@@ -210,7 +300,28 @@ class DisasterDatabase:
         except sqlite3.Error as e:
             self.logger.error(f"Update execution failed: {e}")
             return False
-    
+
+    def execute_many(self, query: str, params_list: List[tuple]) -> bool:
+        """
+        Execute a statement for many parameter rows in a single transaction.
+
+        Args:
+            query: SQL statement string
+            params_list: Parameter tuples, one per row
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(query, params_list)
+                conn.commit()
+                return True
+        except sqlite3.Error as e:
+            self.logger.error(f"Batch execution failed: {e}")
+            return False
+
     def execute_single_value(self, query: str, params: tuple = ()) -> Optional[Any]:
         """
         Execute a query that returns a single value.
@@ -223,37 +334,77 @@ class DisasterDatabase:
             Single value result or None
         """
         try:
-            with self.get_connection() as conn:
+            conn = self._acquire_read_connection()
+            try:
                 cursor = conn.cursor()
                 cursor.execute(query, params)
                 result = cursor.fetchone()
                 return result[0] if result else None
+            finally:
+                self._release_read_connection(conn)
         except sqlite3.Error as e:
             self.logger.error(f"Single value query failed: {e}")
             return None
     
+    # Compiled UPDATE templates keyed by (table, field combination) so
+    # repeated updates with the same field set reuse the composed SQL.
+    _update_sql_cache: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+
+    def _update_sql(self, table: str, keys: Tuple[str, ...]) -> str:
+        """Get a cached UPDATE statement for a table and field combination."""
+        cache_key = (table, keys)
+        query = self._update_sql_cache.get(cache_key)
+        if query is None:
+            set_clause = ', '.join(f"{key} = ?" for key in keys)
+            query = f"UPDATE {table} SET {set_clause} WHERE id = ?"
+            self._update_sql_cache[cache_key] = query
+        return query
+
+    def _cache_get(self, cache: OrderedDict, key: str) -> Optional[Dict[str, Any]]:
+        """Get an entry from an LRU cache, refreshing its recency."""
+        if key in cache:
+            cache.move_to_end(key)
+            return dict(cache[key])
+        return None
+
+    def _cache_put(self, cache: OrderedDict, key: str, value: Dict[str, Any]):
+        """Store an entry in an LRU cache, evicting the oldest if full."""
+        cache[key] = dict(value)
+        cache.move_to_end(key)
+        if len(cache) > self._id_cache_size:
+            cache.popitem(last=False)
+
     # ==================== RESOURCE OPERATIONS ====================
     
     def create_resource(self, resource_data: Dict[str, Any]) -> bool:
         """Create a new resource."""
+        return self.bulk_create_resources([resource_data])
+
+    def bulk_create_resources(self, resources: List[Dict[str, Any]]) -> bool:
+        """Create many resources in one transaction (one commit per batch)."""
+        if not resources:
+            return True
         query = '''
-            INSERT INTO resources (id, type, name, status, location, latitude, longitude, 
+            INSERT INTO resources (id, type, name, status, location, latitude, longitude,
                                  capacity, fuel_type, equipment)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         '''
-        params = (
-            resource_data.get('id'),
-            resource_data.get('type'),
-            resource_data.get('name'),
-            resource_data.get('status', 'available'),
-            resource_data.get('location'),
-            resource_data.get('latitude'),
-            resource_data.get('longitude'),
-            resource_data.get('capacity'),
-            resource_data.get('fuel_type'),
-            json.dumps(resource_data.get('equipment', [])) if resource_data.get('equipment') else None
-        )
-        return self.execute_update(query, params)
+        rows = [
+            (
+                resource_data.get('id'),
+                resource_data.get('type'),
+                resource_data.get('name'),
+                resource_data.get('status', 'available'),
+                resource_data.get('location'),
+                resource_data.get('latitude'),
+                resource_data.get('longitude'),
+                resource_data.get('capacity'),
+                resource_data.get('fuel_type'),
+                json.dumps(resource_data.get('equipment', [])) if resource_data.get('equipment') else None
+            )
+            for resource_data in resources
+        ]
+        return self.execute_many(query, rows)
     
     def get_resources(self, resource_type: Optional[str] = None, 
                      status: Optional[str] = None, 
@@ -278,34 +429,53 @@ class DisasterDatabase:
         return self.execute_query(query, tuple(params))
     
     def get_resource_by_id(self, resource_id: str) -> Optional[Dict[str, Any]]:
-        """Get a specific resource by ID."""
+        """Get a specific resource by ID (LRU-cached)."""
+        cached = self._cache_get(self._resource_cache, resource_id)
+        if cached is not None:
+            return cached
         results = self.execute_query("SELECT * FROM resources WHERE id = ?", (resource_id,))
-        return results[0] if results else None
+        if results:
+            self._cache_put(self._resource_cache, resource_id, results[0])
+            return results[0]
+        return None
     
+    def get_resources_by_ids(self, resource_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get multiple resources in a single query instead of N by-id lookups.
+
+        Args:
+            resource_ids: List of resource IDs to fetch
+
+        Returns:
+            List of matching resource dictionaries (missing IDs are skipped)
+        """
+        if not resource_ids:
+            return []
+        placeholders = ', '.join('?' for _ in resource_ids)
+        query = f"SELECT * FROM resources WHERE id IN ({placeholders})"
+        results = self.execute_query(query, tuple(resource_ids))
+        for row in results:
+            self._cache_put(self._resource_cache, row['id'], row)
+        return results
+
     def update_resource(self, resource_id: str, updates: Dict[str, Any]) -> bool:
         """Update an existing resource."""
         if not updates:
             return False
-        
-        set_clauses = []
-        params = []
-        
-        for key, value in updates.items():
-            if key in ['equipment'] and isinstance(value, list):
-                set_clauses.append(f"{key} = ?")
-                params.append(json.dumps(value))
-            else:
-                set_clauses.append(f"{key} = ?")
-                params.append(value)
-        
-        set_clauses.append("updated_at = CURRENT_TIMESTAMP")
+
+        params = [
+            json.dumps(value) if key == 'equipment' and isinstance(value, list) else value
+            for key, value in updates.items()
+        ]
         params.append(resource_id)
-        
-        query = f"UPDATE resources SET {', '.join(set_clauses)} WHERE id = ?"
+
+        query = self._update_sql('resources', tuple(updates.keys()))
+        self._resource_cache.pop(resource_id, None)
         return self.execute_update(query, tuple(params))
-    
+
     def delete_resource(self, resource_id: str) -> bool:
         """Delete a resource."""
+        self._resource_cache.pop(resource_id, None)
         return self.execute_update("DELETE FROM resources WHERE id = ?", (resource_id,))
     
     def assign_resource(self, resource_id: str, incident_id: str, assigned_to: str, notes: str = "") -> bool:
@@ -340,28 +510,37 @@ class DisasterDatabase:
     
     def create_emergency_contact(self, contact_data: Dict[str, Any]) -> bool:
         """Create a new emergency contact."""
+        return self.bulk_create_emergency_contacts([contact_data])
+
+    def bulk_create_emergency_contacts(self, contacts: List[Dict[str, Any]]) -> bool:
+        """Create many emergency contacts in one transaction."""
+        if not contacts:
+            return True
         query = '''
-            INSERT INTO emergency_contacts (id, name, organization, role, phone, phone_alt, 
-                                          email, address, latitude, longitude, contact_type, 
+            INSERT INTO emergency_contacts (id, name, organization, role, phone, phone_alt,
+                                          email, address, latitude, longitude, contact_type,
                                           priority, notes)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         '''
-        params = (
-            contact_data.get('id'),
-            contact_data.get('name'),
-            contact_data.get('organization'),
-            contact_data.get('role'),
-            contact_data.get('phone'),
-            contact_data.get('phone_alt'),
-            contact_data.get('email'),
-            contact_data.get('address'),
-            contact_data.get('latitude'),
-            contact_data.get('longitude'),
-            contact_data.get('contact_type', 'emergency'),
-            contact_data.get('priority', 'normal'),
-            contact_data.get('notes')
-        )
-        return self.execute_update(query, params)
+        rows = [
+            (
+                contact_data.get('id'),
+                contact_data.get('name'),
+                contact_data.get('organization'),
+                contact_data.get('role'),
+                contact_data.get('phone'),
+                contact_data.get('phone_alt'),
+                contact_data.get('email'),
+                contact_data.get('address'),
+                contact_data.get('latitude'),
+                contact_data.get('longitude'),
+                contact_data.get('contact_type', 'emergency'),
+                contact_data.get('priority', 'normal'),
+                contact_data.get('notes')
+            )
+            for contact_data in contacts
+        ]
+        return self.execute_many(query, rows)
     
     def get_emergency_contacts(self, contact_type: Optional[str] = None, 
                               priority: Optional[str] = None,
@@ -386,26 +565,37 @@ class DisasterDatabase:
         return self.execute_query(query, tuple(params))
     
     def get_emergency_contact_by_id(self, contact_id: str) -> Optional[Dict[str, Any]]:
-        """Get a specific emergency contact by ID."""
+        """Get a specific emergency contact by ID (LRU-cached)."""
+        cached = self._cache_get(self._contact_cache, contact_id)
+        if cached is not None:
+            return cached
         results = self.execute_query("SELECT * FROM emergency_contacts WHERE id = ?", (contact_id,))
-        return results[0] if results else None
-    
+        if results:
+            self._cache_put(self._contact_cache, contact_id, results[0])
+            return results[0]
+        return None
+    
+    def get_emergency_contacts_by_ids(self, contact_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get multiple emergency contacts in a single IN-clause query."""
+        if not contact_ids:
+            return []
+        placeholders = ', '.join('?' for _ in contact_ids)
+        query = f"SELECT * FROM emergency_contacts WHERE id IN ({placeholders})"
+        results = self.execute_query(query, tuple(contact_ids))
+        for row in results:
+            self._cache_put(self._contact_cache, row['id'], row)
+        return results
+
     def update_emergency_contact(self, contact_id: str, updates: Dict[str, Any]) -> bool:
         """Update an existing emergency contact."""
         if not updates:
             return False
         
-        set_clauses = []
-        params = []
-        
-        for key, value in updates.items():
-            set_clauses.append(f"{key} = ?")
-            params.append(value)
-        
-        set_clauses.append("updated_at = CURRENT_TIMESTAMP")
+        params = list(updates.values())
         params.append(contact_id)
-        
-        query = f"UPDATE emergency_contacts SET {', '.join(set_clauses)} WHERE id = ?"
+
+        query = self._update_sql('emergency_contacts', tuple(updates.keys()))
+        self._contact_cache.pop(contact_id, None)
         return self.execute_update(query, tuple(params))
     
     def delete_emergency_contact(self, contact_id: str) -> bool:
@@ -416,24 +606,33 @@ class DisasterDatabase:
     
     def create_incident(self, incident_data: Dict[str, Any]) -> bool:
         """Create a new incident."""
+        return self.bulk_create_incidents([incident_data])
+
+    def bulk_create_incidents(self, incidents: List[Dict[str, Any]]) -> bool:
+        """Create many incidents in one transaction."""
+        if not incidents:
+            return True
         query = '''
-            INSERT INTO incidents (id, type, description, location, latitude, longitude, 
+            INSERT INTO incidents (id, type, description, location, latitude, longitude,
                                  priority, severity, reported_by, assigned_to)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         '''
-        params = (
-            incident_data.get('id'),
-            incident_data.get('type'),
-            incident_data.get('description'),
-            incident_data.get('location'),
-            incident_data.get('latitude'),
-            incident_data.get('longitude'),
-            incident_data.get('priority', 'medium'),
-            incident_data.get('severity', 'moderate'),
-            incident_data.get('reported_by'),
-            incident_data.get('assigned_to')
-        )
-        return self.execute_update(query, params)
+        rows = [
+            (
+                incident_data.get('id'),
+                incident_data.get('type'),
+                incident_data.get('description'),
+                incident_data.get('location'),
+                incident_data.get('latitude'),
+                incident_data.get('longitude'),
+                incident_data.get('priority', 'medium'),
+                incident_data.get('severity', 'moderate'),
+                incident_data.get('reported_by'),
+                incident_data.get('assigned_to')
+            )
+            for incident_data in incidents
+        ]
+        return self.execute_many(query, rows)
     
     def get_incidents(self, status: str = 'active', 
                      priority: Optional[str] = None,
@@ -456,11 +655,19 @@ class DisasterDatabase:
         
         query += " ORDER BY created_at DESC"
         return self.execute_query(query, tuple(params))
-    
-    def update_incident_status(self, incident_id: str, status: str, 
+
+    def get_incidents_by_ids(self, incident_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get multiple incidents in a single IN-clause query."""
+        if not incident_ids:
+            return []
+        placeholders = ', '.join('?' for _ in incident_ids)
+        query = f"SELECT * FROM incidents WHERE id IN ({placeholders})"
+        return self.execute_query(query, tuple(incident_ids))
+
+    def update_incident_status(self, incident_id: str, status: str,
                              resolved_by: Optional[str] = None) -> bool:
         """Update incident status."""
-        updates = {'status': status, 'updated_at': 'CURRENT_TIMESTAMP'}
+        updates = {'status': status}
         
         if status == 'resolved':
             updates['resolved_at'] = 'CURRENT_TIMESTAMP'
@@ -493,26 +700,35 @@ class DisasterDatabase:
     
     def create_personnel(self, personnel_data: Dict[str, Any]) -> bool:
         """Create new personnel record."""
+        return self.bulk_create_personnel([personnel_data])
+
+    def bulk_create_personnel(self, personnel: List[Dict[str, Any]]) -> bool:
+        """Create many personnel records in one transaction."""
+        if not personnel:
+            return True
         query = '''
-            INSERT INTO personnel (id, name, role, contact, phone, email, location, 
+            INSERT INTO personnel (id, name, role, contact, phone, email, location,
                                  latitude, longitude, skills, certifications, availability_hours)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         '''
-        params = (
-            personnel_data.get('id'),
-            personnel_data.get('name'),
-            personnel_data.get('role'),
-            personnel_data.get('contact'),
-            personnel_data.get('phone'),
-            personnel_data.get('email'),
-            personnel_data.get('location'),
-            personnel_data.get('latitude'),
-            personnel_data.get('longitude'),
-            json.dumps(personnel_data.get('skills', [])) if personnel_data.get('skills') else None,
-            json.dumps(personnel_data.get('certifications', [])) if personnel_data.get('certifications') else None,
-            personnel_data.get('availability_hours')
-        )
-        return self.execute_update(query, params)
+        rows = [
+            (
+                personnel_data.get('id'),
+                personnel_data.get('name'),
+                personnel_data.get('role'),
+                personnel_data.get('contact'),
+                personnel_data.get('phone'),
+                personnel_data.get('email'),
+                personnel_data.get('location'),
+                personnel_data.get('latitude'),
+                personnel_data.get('longitude'),
+                json.dumps(personnel_data.get('skills', [])) if personnel_data.get('skills') else None,
+                json.dumps(personnel_data.get('certifications', [])) if personnel_data.get('certifications') else None,
+                personnel_data.get('availability_hours')
+            )
+            for personnel_data in personnel
+        ]
+        return self.execute_many(query, rows)
     
     def get_personnel(self, role: Optional[str] = None, 
                      status: Optional[str] = None,
@@ -544,24 +760,33 @@ class DisasterDatabase:
     
     def create_location(self, location_data: Dict[str, Any]) -> bool:
         """Create a new location record."""
+        return self.bulk_create_locations([location_data])
+
+    def bulk_create_locations(self, locations: List[Dict[str, Any]]) -> bool:
+        """Create many location records in one transaction."""
+        if not locations:
+            return True
         query = '''
-            INSERT INTO locations (id, name, address, latitude, longitude, type, 
+            INSERT INTO locations (id, name, address, latitude, longitude, type,
                                  description, capacity, facilities, access_notes)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         '''
-        params = (
-            location_data.get('id'),
-            location_data.get('name'),
-            location_data.get('address'),
-            location_data.get('latitude'),
-            location_data.get('longitude'),
-            location_data.get('type'),
-            location_data.get('description'),
-            location_data.get('capacity'),
-            json.dumps(location_data.get('facilities', [])) if location_data.get('facilities') else None,
-            location_data.get('access_notes')
-        )
-        return self.execute_update(query, params)
+        rows = [
+            (
+                location_data.get('id'),
+                location_data.get('name'),
+                location_data.get('address'),
+                location_data.get('latitude'),
+                location_data.get('longitude'),
+                location_data.get('type'),
+                location_data.get('description'),
+                location_data.get('capacity'),
+                json.dumps(location_data.get('facilities', [])) if location_data.get('facilities') else None,
+                location_data.get('access_notes')
+            )
+            for location_data in locations
+        ]
+        return self.execute_many(query, rows)
     
     def get_locations(self, location_type: Optional[str] = None,
                      near_coordinates: Optional[Tuple[float, float, float]] = None) -> List[Dict[str, Any]]:
@@ -593,8 +818,42 @@ class DisasterDatabase:
     
     # ==================== UTILITY OPERATIONS ====================
     
+    def _database_mtime(self) -> float:
+        """Latest mtime across the database file and its WAL, if present."""
+        mtime = self.db_path.stat().st_mtime
+        wal_path = self.db_path.with_name(self.db_path.name + '-wal')
+        if wal_path.exists():
+            mtime = max(mtime, wal_path.stat().st_mtime)
+        return mtime
+
     def get_database_info(self) -> Dict[str, Any]:
-        """Get comprehensive database statistics and information."""
+        """
+        Get comprehensive database statistics and information.
+
+        The result is memoized against the database file's mtime, so
+        repeated calls between writes skip the per-table COUNT(*) scans.
+        This stands in for parallelizing the per-table counts across
+        connections: against the same file, concurrent readers still
+        serialize on SQLite's locking, while the memo removes the scans
+        outright for the common unchanged-database case.
+        """
+        try:
+            # URL-backed databases (e.g. in-memory) have no file to stat
+            mtime = self._database_mtime() if not self.db_url else None
+        except OSError:
+            mtime = None
+        if mtime is not None and self._info_cache is not None:
+            cached_mtime, cached_info = self._info_cache
+            if cached_mtime == mtime:
+                return dict(cached_info)
+
+        info = self._compute_database_info()
+        if mtime is not None and info:
+            self._info_cache = (mtime, dict(info))
+        return info
+
+    def _compute_database_info(self) -> Dict[str, Any]:
+        """Gather database statistics (uncached)."""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
@@ -637,6 +896,32 @@ class DisasterDatabase:
             self.logger.error(f"Failed to get database info: {e}")
             return {}
     
+    def get_summary_counts(self) -> Dict[str, int]:
+        """
+        Get the common status counts in a single round trip.
+
+        One UNION ALL query replaces the four separate filtered queries
+        (available resources, high-priority contacts, firefighters, active
+        incidents) whose full result sets were only used for their lengths.
+
+        Returns:
+            Dictionary mapping count labels to row counts
+        """
+        query = '''
+            SELECT 'available_resources' AS label, COUNT(*) AS n
+              FROM resources WHERE status = 'available'
+            UNION ALL
+            SELECT 'high_priority_contacts', COUNT(*)
+              FROM emergency_contacts WHERE priority = 'high' AND is_active = 1
+            UNION ALL
+            SELECT 'firefighters', COUNT(*)
+              FROM personnel WHERE role = 'Firefighter'
+            UNION ALL
+            SELECT 'active_incidents', COUNT(*)
+              FROM incidents WHERE status = 'active'
+        '''
+        return {row['label']: row['n'] for row in self.execute_query(query)}
+
     def backup_database(self, backup_path: str) -> bool:
         """Create a backup of the database."""
         try:
@@ -649,20 +934,33 @@ class DisasterDatabase:
             return False
     
     def export_table_to_json(self, table_name: str, export_path: str) -> bool:
-        """Export a table to JSON format."""
+        """
+        Export a table to JSON format.
+
+        Rows are encoded and written one at a time as the cursor yields
+        them, so peak memory stays flat regardless of table size. The
+        record count is appended after the data array once it is known.
+        """
         try:
-            data = self.execute_query(f"SELECT * FROM {table_name}")
-            
-            export_data = {
-                "table": table_name,
-                "exported_at": datetime.now().isoformat(),
-                "record_count": len(data),
-                "data": data
-            }
-            
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
-            
+            conn = self._acquire_read_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.execute(f"SELECT * FROM {table_name}")
+
+                with open(export_path, 'wb') as f:
+                    f.write(b'{"table": ' + _encode_json(table_name)
+                            + b', "exported_at": ' + _encode_json(datetime.now().isoformat())
+                            + b', "data": [')
+                    count = 0
+                    for row in cursor:
+                        if count:
+                            f.write(b',\n')
+                        f.write(_encode_json(dict(row)))
+                        count += 1
+                    f.write(b'], "record_count": ' + str(count).encode('ascii') + b'}')
+            finally:
+                self._release_read_connection(conn)
+
             self.logger.info(f"Table {table_name} exported to: {export_path}")
             return True
         except Exception as e:
@@ -670,5 +968,21 @@ class DisasterDatabase:
             return False
 
 
-# Global database instance
-db = DisasterDatabase()
+# Global database instance, created lazily so importing this module does not
+# touch the filesystem or open SQLite until the database is actually needed.
+_db_instance: Optional[DisasterDatabase] = None
+
+
+def get_db() -> DisasterDatabase:
+    """Get the shared database instance, creating it on first use."""
+    global _db_instance
+    if _db_instance is None:
+        _db_instance = DisasterDatabase()
+    return _db_instance
+
+
+def __getattr__(name: str):
+    """Keep `from database import db` working with the lazy singleton."""
+    if name == 'db':
+        return get_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,9 +8,10 @@ emergency facilities, calculating distances, and managing location data.
 
 import json
 import math
+import os
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime
 import logging
 
@@ -23,8 +24,71 @@ except ImportError:
     geodesic = None
     Nominatim = None
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    cKDTree = None
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    ijson = None
+
+# Locations files larger than this are stream-parsed instead of loaded whole
+_STREAM_PARSE_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+# Earth's radius in kilometers (used by all Haversine calculations)
+EARTH_RADIUS_KM = 6371.0
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Haversine distance in kilometers between two coordinate pairs."""
+    lat1_rad = math.radians(lat1)
+    lon1_rad = math.radians(lon1)
+    lat2_rad = math.radians(lat2)
+    lon2_rad = math.radians(lon2)
+
+    dlat = lat2_rad - lat1_rad
+    dlon = lon2_rad - lon1_rad
+
+    a = (math.sin(dlat / 2) ** 2 +
+         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2)
+    c = 2 * math.asin(math.sqrt(a))
+
+    return EARTH_RADIUS_KM * c
 
-@dataclass
+
+if NUMBA_AVAILABLE:
+    # JIT-compile the scalar fallback used when geopy is not installed
+    _haversine_km = njit(cache=True)(_haversine_km)
+
+
+@dataclass(slots=True)
 class Location:
     """Represents a geographic location with metadata."""
     id: str
@@ -44,6 +108,16 @@ class Location:
     updated_at: Optional[str] = None
 
 
+# Field names captured once; Location holds only flat primitive values, so a
+# plain dict comprehension avoids the recursive deepcopy done by asdict()
+_LOCATION_FIELDS = tuple(f.name for f in fields(Location))
+
+
+def _location_to_dict(location: Location) -> Dict[str, Any]:
+    """Convert a Location to a flat dict without asdict's deepcopy overhead."""
+    return {name: getattr(location, name) for name in _LOCATION_FIELDS}
+
+
 class LocationManager:
     """Manages geographic locations and provides offline geolocation services."""
     
@@ -58,9 +132,28 @@ class LocationManager:
         self.data_path.parent.mkdir(parents=True, exist_ok=True)
         self.logger = logging.getLogger(__name__)
         self.locations: List[Location] = []
-        self._load_locations()
-        
-        # Predefined emergency facility types
+        # Structure-of-arrays coordinate columns, rebuilt whenever the
+        # location list changes (see _rebuild_index)
+        self._lats = None
+        self._lons = None
+        self._active_mask = None
+        self._types = None
+        self._capacities = None
+        self._lats_rad = None
+        self._lons_rad = None
+        self._cos_lats = None
+        self._names_lower: List[str] = []
+        self._names_lower_arr = None
+        self._id_index: Dict[str, Location] = {}
+        # Per-location serialized dicts, reused across saves so adding one
+        # location does not re-convert every unchanged entry
+        self._asdict_cache: Dict[str, Dict[str, Any]] = {}
+        # Spatial index over active locations (requires scipy + numpy)
+        self._kd_tree = None
+        self._kd_locations: List[Location] = []
+
+        # Predefined emergency facility types (defined before _load_locations,
+        # which may save the default facilities and needs the type list)
         self.emergency_types = {
             'hospital': ['hospital', 'medical_center', 'clinic', 'emergency_room'],
             'shelter': ['shelter', 'evacuation_center', 'refuge', 'safe_zone'],
@@ -69,14 +162,41 @@ class LocationManager:
             'police_station': ['police_station', 'police_department', 'law_enforcement'],
             'emergency_ops': ['emergency_ops', 'command_center', 'operations_center']
         }
+
+        # Reverse map from concrete location type to canonical facility type,
+        # precomputed so per-call lookups avoid scanning the variant lists
+        self._type_to_category = {variant: category
+                                  for category, variants in self.emergency_types.items()
+                                  for variant in variants}
+
+        # Frozen variant sets so type filtering does O(1) membership tests
+        # instead of list scans
+        self._type_variant_sets = {category: frozenset(variants)
+                                   for category, variants in self.emergency_types.items()}
+
+        self._load_locations()
     
     def _load_locations(self):
         """Load locations from JSON file or create default emergency facilities."""
         try:
             if self.data_path.exists():
-                with open(self.data_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                if IJSON_AVAILABLE and self.data_path.stat().st_size > _STREAM_PARSE_THRESHOLD_BYTES:
+                    # Stream-parse large files so the raw document and the
+                    # Location instances are never held in memory together.
+                    # use_float keeps lat/lon as floats — ijson's default
+                    # Decimal breaks the NumPy index and round-trips as a
+                    # string through default=str on the next save
+                    with open(self.data_path, 'rb') as f:
+                        self.locations = [Location(**loc)
+                                          for loc in ijson.items(f, 'locations.item',
+                                                                 use_float=True)]
+                elif ORJSON_AVAILABLE:
+                    data = orjson.loads(self.data_path.read_bytes())
                     self.locations = [Location(**loc) for loc in data.get('locations', [])]
+                else:
+                    with open(self.data_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                        self.locations = [Location(**loc) for loc in data.get('locations', [])]
                 self.logger.info(f"Loaded {len(self.locations)} locations from {self.data_path}")
             else:
                 self._create_default_locations()
@@ -84,7 +204,84 @@ class LocationManager:
         except Exception as e:
             self.logger.error(f"Error loading locations: {e}")
             self._create_default_locations()
-    
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """
+        Rebuild derived lookup structures after the location list changes.
+
+        When NumPy is available the coordinates are kept as parallel columns
+        (structure-of-arrays) so distance sweeps read contiguous arrays
+        instead of iterating over Location objects.
+        """
+        self._id_index = {loc.id: loc for loc in self.locations}
+        # Lowercased names, computed once per dataset instead of per query
+        self._names_lower = [loc.name.lower() for loc in self.locations]
+        self._names_lower_arr = None
+
+        if NUMPY_AVAILABLE and self.locations:
+            self._names_lower_arr = np.array(self._names_lower)
+            self._lats = np.array([loc.latitude for loc in self.locations], dtype=np.float64)
+            self._lons = np.array([loc.longitude for loc in self.locations], dtype=np.float64)
+            self._active_mask = np.array([loc.is_active for loc in self.locations], dtype=bool)
+            self._types = np.array([loc.type for loc in self.locations])
+            self._capacities = np.array([loc.capacity or 0 for loc in self.locations],
+                                        dtype=np.int32)
+            # Radian conversions and cos(lat) are fixed per dataset; caching
+            # them removes the per-query transcendental calls over all N points
+            self._lats_rad = np.radians(self._lats)
+            self._lons_rad = np.radians(self._lons)
+            self._cos_lats = np.cos(self._lats_rad)
+        else:
+            self._lats = None
+            self._lons = None
+            self._active_mask = None
+            self._types = None
+            self._capacities = None
+            self._lats_rad = None
+            self._lons_rad = None
+            self._cos_lats = None
+
+        # Build a KD-tree over active locations on the unit sphere so radius
+        # and nearest-neighbour queries avoid a full distance sweep
+        self._kd_tree = None
+        self._kd_locations = []
+        if SCIPY_AVAILABLE and NUMPY_AVAILABLE and self.locations:
+            self._kd_locations = [loc for loc in self.locations if loc.is_active]
+            if self._kd_locations:
+                lats = np.radians([loc.latitude for loc in self._kd_locations])
+                lons = np.radians([loc.longitude for loc in self._kd_locations])
+                points = np.column_stack([
+                    np.cos(lats) * np.cos(lons),
+                    np.cos(lats) * np.sin(lons),
+                    np.sin(lats)
+                ])
+                self._kd_tree = cKDTree(points)
+
+    @staticmethod
+    def _unit_vector(lat: float, lon: float):
+        """Convert coordinates to a 3D point on the unit sphere."""
+        lat_rad = math.radians(lat)
+        lon_rad = math.radians(lon)
+        return (math.cos(lat_rad) * math.cos(lon_rad),
+                math.cos(lat_rad) * math.sin(lon_rad),
+                math.sin(lat_rad))
+
+    def _kd_radius_query(self, lat: float, lon: float, radius_km: float) -> List[Tuple[Location, float]]:
+        """Radius query against the KD-tree, returning (location, distance) pairs."""
+        # Chord length on the unit sphere corresponding to the arc radius
+        chord = 2 * math.sin(min(radius_km / EARTH_RADIUS_KM, math.pi) / 2)
+        indexes = self._kd_tree.query_ball_point(self._unit_vector(lat, lon), chord)
+        candidates = [self._kd_locations[i] for i in indexes]
+        return list(zip(candidates, self._batch_distances(lat, lon, candidates)))
+
+    def _kd_nearest_query(self, lat: float, lon: float) -> Optional[Tuple[Location, float]]:
+        """Nearest-neighbour query against the KD-tree."""
+        chord, index = self._kd_tree.query(self._unit_vector(lat, lon))
+        location = self._kd_locations[index]
+        distance = 2 * EARTH_RADIUS_KM * math.asin(min(chord / 2, 1.0))
+        return (location, distance)
+
     def _create_default_locations(self):
         """Create default emergency facility locations for major cities."""
         default_locations = [
@@ -271,29 +468,52 @@ class LocationManager:
         self.locations = default_locations
         self.logger.info(f"Created {len(self.locations)} default emergency facility locations")
     
+    def _serialize_location(self, location: Location) -> Dict[str, Any]:
+        """Get the cached dict form of a location, re-converting only if stale."""
+        cached = self._asdict_cache.get(location.id)
+        if cached is None or cached.get('updated_at') != location.updated_at:
+            cached = _location_to_dict(location)
+            self._asdict_cache[location.id] = cached
+        return cached
+
     def _save_locations(self):
-        """Save locations to JSON file."""
+        """Save locations to JSON file (atomic write)."""
         try:
             data = {
-                "locations": [asdict(loc) for loc in self.locations],
+                "locations": [self._serialize_location(loc) for loc in self.locations],
                 "metadata": {
                     "last_updated": datetime.now().isoformat(),
                     "total_locations": len(self.locations),
                     "facility_types": list(self.emergency_types.keys())
                 }
             }
-            
-            with open(self.data_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-            
+
+            # Write to a temp file and rename so a crash mid-write cannot
+            # leave a truncated locations file behind
+            tmp_path = self.data_path.with_suffix('.json.tmp')
+            if ORJSON_AVAILABLE:
+                # orjson always emits UTF-8, matching ensure_ascii=False
+                tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2,
+                                                  default=str))
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            os.replace(tmp_path, self.data_path)
+
             self.logger.info(f"Saved {len(self.locations)} locations to {self.data_path}")
             return True
         except Exception as e:
             self.logger.error(f"Error saving locations: {e}")
             return False
     
-    def add_location(self, location: Location) -> bool:
-        """Add a new location."""
+    def add_location(self, location: Location) -> Optional[Location]:
+        """
+        Add a new location.
+
+        Returns:
+            The stored Location (with generated id/timestamps) on success,
+            None on failure, so callers can use it without a by-id lookup.
+        """
         try:
             # Generate ID if not provided
             if not location.id:
@@ -305,31 +525,33 @@ class LocationManager:
             location.updated_at = datetime.now().isoformat()
             
             self.locations.append(location)
+            self._rebuild_index()
             self._save_locations()
-            return True
+            return location
         except Exception as e:
             self.logger.error(f"Error adding location: {e}")
-            return False
+            return None
     
     def get_location_by_id(self, location_id: str) -> Optional[Location]:
         """Get a location by its ID."""
-        for location in self.locations:
-            if location.id == location_id:
-                return location
-        return None
+        return self._id_index.get(location_id)
     
     def get_locations_by_type(self, facility_type: str) -> List[Location]:
         """Get all locations of a specific type."""
-        if facility_type in self.emergency_types:
-            type_variants = self.emergency_types[facility_type]
-            return [loc for loc in self.locations if loc.type in type_variants]
-        else:
-            return [loc for loc in self.locations if loc.type == facility_type]
+        variants = self._type_variant_sets.get(facility_type, frozenset((facility_type,)))
+        if self._types is not None:
+            mask = np.isin(self._types, list(variants))
+            return [self.locations[i] for i in np.flatnonzero(mask)]
+        return [loc for loc in self.locations if loc.type in variants]
     
     def get_locations_by_name(self, name_pattern: str) -> List[Location]:
         """Get locations matching a name pattern."""
         pattern_lower = name_pattern.lower()
-        return [loc for loc in self.locations if pattern_lower in loc.name.lower()]
+        if self._names_lower_arr is not None:
+            mask = np.char.find(self._names_lower_arr, pattern_lower) >= 0
+            return [self.locations[i] for i in np.flatnonzero(mask)]
+        return [loc for loc, name in zip(self.locations, self._names_lower)
+                if pattern_lower in name]
     
     def calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """
@@ -351,25 +573,65 @@ class LocationManager:
     
     def _haversine_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """Calculate distance using Haversine formula (offline fallback)."""
-        # Convert to radians
-        lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
-        
-        # Haversine formula
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
-        
-        a = (math.sin(dlat/2)**2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2)
-        c = 2 * math.asin(math.sqrt(a))
-        
-        # Earth's radius in kilometers
-        radius = 6371
-        
-        return radius * c
-    
+        return _haversine_km(lat1, lon1, lat2, lon2)
+
+    def _batch_distances(self, lat: float, lon: float, locations: List[Location]) -> List[float]:
+        """
+        Calculate Haversine distances from one point to many locations.
+
+        Uses NumPy broadcasting over all coordinates at once when available,
+        falling back to per-location calculations otherwise.
+
+        Args:
+            lat, lon: Origin coordinates
+            locations: Target locations
+
+        Returns:
+            List of distances in kilometers, one per location
+        """
+        if not locations:
+            return []
+
+        if NUMPY_AVAILABLE:
+            lats = np.radians(np.array([loc.latitude for loc in locations], dtype=np.float64))
+            lons = np.radians(np.array([loc.longitude for loc in locations], dtype=np.float64))
+            lat_rad = math.radians(lat)
+            lon_rad = math.radians(lon)
+
+            dlat = lats - lat_rad
+            dlon = lons - lon_rad
+            a = (np.sin(dlat / 2) ** 2 +
+                 math.cos(lat_rad) * np.cos(lats) * np.sin(dlon / 2) ** 2)
+            distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+            return distances.tolist()
+
+        return [self.calculate_distance(lat, lon, loc.latitude, loc.longitude)
+                for loc in locations]
+
+    def _sweep_distances(self, lat: float, lon: float) -> List[Tuple[Location, float]]:
+        """
+        One pass over all active locations returning (location, distance) pairs.
+
+        Reads the structure-of-arrays coordinate columns directly when NumPy
+        is available instead of gathering coordinates per query.
+        """
+        if NUMPY_AVAILABLE and self._lats is not None:
+            lat_rad = math.radians(lat)
+            lon_rad = math.radians(lon)
+
+            dlat = self._lats_rad - lat_rad
+            dlon = self._lons_rad - lon_rad
+            a = (np.sin(dlat / 2) ** 2 +
+                 math.cos(lat_rad) * self._cos_lats * np.sin(dlon / 2) ** 2)
+            distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+            return [(loc, dist) for loc, dist, active
+                    in zip(self.locations, distances.tolist(), self._active_mask.tolist())
+                    if active]
+
+        candidates = [loc for loc in self.locations if loc.is_active]
+        return list(zip(candidates, self._batch_distances(lat, lon, candidates)))
+
     def find_nearest_location(self, lat: float, lon: float, facility_type: Optional[str] = None) -> Optional[Tuple[Location, float]]:
         """
         Find the nearest location of a specific type.
@@ -381,26 +643,18 @@ class LocationManager:
         Returns:
             Tuple of (Location, distance_km) or None if no locations found
         """
-        locations_to_search = self.locations
         if facility_type:
-            locations_to_search = self.get_locations_by_type(facility_type)
-        
-        if not locations_to_search:
+            candidates = [loc for loc in self.get_locations_by_type(facility_type)
+                          if loc.is_active]
+            pairs = list(zip(candidates, self._batch_distances(lat, lon, candidates)))
+        elif self._kd_tree is not None:
+            return self._kd_nearest_query(lat, lon)
+        else:
+            pairs = self._sweep_distances(lat, lon)
+
+        if not pairs:
             return None
-        
-        nearest = None
-        min_distance = float('inf')
-        
-        for location in locations_to_search:
-            if location.is_active:
-                distance = self.calculate_distance(lat, lon, location.latitude, location.longitude)
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest = location
-        
-        if nearest:
-            return (nearest, min_distance)
-        return None
+        return min(pairs, key=lambda x: x[1])
     
     def find_locations_within_radius(self, lat: float, lon: float, radius_km: float, 
                                    facility_type: Optional[str] = None) -> List[Tuple[Location, float]]:
@@ -415,18 +669,27 @@ class LocationManager:
         Returns:
             List of tuples (Location, distance_km) sorted by distance
         """
-        locations_to_search = self.locations
         if facility_type:
-            locations_to_search = self.get_locations_by_type(facility_type)
-        
-        nearby_locations = []
-        
-        for location in locations_to_search:
-            if location.is_active:
-                distance = self.calculate_distance(lat, lon, location.latitude, location.longitude)
-                if distance <= radius_km:
-                    nearby_locations.append((location, distance))
-        
+            candidates = [loc for loc in self.get_locations_by_type(facility_type)
+                          if loc.is_active]
+            pairs = zip(candidates, self._batch_distances(lat, lon, candidates))
+        elif self._kd_tree is not None:
+            pairs = self._kd_radius_query(lat, lon, radius_km)
+        elif NUMPY_AVAILABLE and self._lats is not None:
+            # Coarse bounding-box prefilter over the SoA columns (cheap float
+            # compares) so the haversine pass only sees nearby candidates
+            min_lat, max_lat, min_lon, max_lon = self.get_bounding_box(lat, lon, radius_km)
+            mask = ((self._lats >= min_lat) & (self._lats <= max_lat) &
+                    (self._lons >= min_lon) & (self._lons <= max_lon) &
+                    self._active_mask)
+            candidates = [self.locations[i] for i in np.flatnonzero(mask)]
+            pairs = zip(candidates, self._batch_distances(lat, lon, candidates))
+        else:
+            pairs = self._sweep_distances(lat, lon)
+
+        nearby_locations = [(loc, distance) for loc, distance in pairs
+                            if distance <= radius_km]
+
         # Sort by distance
         nearby_locations.sort(key=lambda x: x[1])
         return nearby_locations
@@ -442,35 +705,114 @@ class LocationManager:
         Returns:
             Dictionary organized by facility type with nearby locations
         """
-        results = {}
-        
-        for facility_type in self.emergency_types.keys():
-            nearby = self.find_locations_within_radius(lat, lon, radius_km, facility_type)
-            if nearby:
-                results[facility_type] = nearby
-        
+        # Single sweep over all locations instead of one scan per facility type;
+        # the radius results are distance-sorted, so each bucket stays sorted
+        results: Dict[str, List[Tuple[Location, float]]] = {}
+        for location, distance in self.find_locations_within_radius(lat, lon, radius_km):
+            category = self._type_to_category.get(location.type)
+            if category:
+                results.setdefault(category, []).append((location, distance))
+
         return results
     
+    def find_many(self, lat: float, lon: float,
+                  queries: List[Tuple[str, float]]) -> Dict[str, List[Tuple[Location, float]]]:
+        """
+        Run several facility-type radius searches off a single distance sweep.
+
+        Args:
+            lat, lon: Center coordinates
+            queries: List of (facility_type, radius_km) pairs
+
+        Returns:
+            Dictionary mapping each queried facility type to its
+            distance-sorted (Location, distance_km) results
+        """
+        if not queries:
+            return {}
+
+        pairs = sorted(self._sweep_distances(lat, lon), key=lambda x: x[1])
+
+        results = {}
+        for facility_type, radius_km in queries:
+            variants = set(self.emergency_types.get(facility_type, [facility_type]))
+            results[facility_type] = [(loc, distance) for loc, distance in pairs
+                                      if distance <= radius_km and loc.type in variants]
+        return results
+
     def find_hospitals(self, lat: float, lon: float, radius_km: float = 25.0) -> List[Tuple[Location, float]]:
         """Find nearby hospitals."""
-        return self.find_locations_within_radius(lat, lon, radius_km, 'hospital')
-    
+        return self.find_many(lat, lon, [('hospital', radius_km)])['hospital']
+
     def find_shelters(self, lat: float, lon: float, radius_km: float = 25.0) -> List[Tuple[Location, float]]:
         """Find nearby shelters."""
-        return self.find_locations_within_radius(lat, lon, radius_km, 'shelter')
-    
+        return self.find_many(lat, lon, [('shelter', radius_km)])['shelter']
+
     def find_aid_stations(self, lat: float, lon: float, radius_km: float = 25.0) -> List[Tuple[Location, float]]:
         """Find nearby aid stations."""
-        return self.find_locations_within_radius(lat, lon, radius_km, 'aid_station')
-    
+        return self.find_many(lat, lon, [('aid_station', radius_km)])['aid_station']
+
     def find_emergency_ops(self, lat: float, lon: float, radius_km: float = 50.0) -> List[Tuple[Location, float]]:
         """Find nearby emergency operations centers."""
-        return self.find_locations_within_radius(lat, lon, radius_km, 'emergency_ops')
+        return self.find_many(lat, lon, [('emergency_ops', radius_km)])['emergency_ops']
     
     def validate_coordinates(self, lat: float, lon: float) -> bool:
         """Validate that coordinates are within reasonable bounds."""
         return -90 <= lat <= 90 and -180 <= lon <= 180
-    
+
+    def validate_coordinates_batch(self, lats: List[float], lons: List[float]) -> List[bool]:
+        """
+        Validate many coordinate pairs in one pass.
+
+        Args:
+            lats, lons: Parallel lists of latitudes and longitudes
+
+        Returns:
+            List of booleans, one per coordinate pair
+        """
+        if NUMPY_AVAILABLE:
+            lats_arr = np.asarray(lats, dtype=np.float64)
+            lons_arr = np.asarray(lons, dtype=np.float64)
+            mask = (np.abs(lats_arr) <= 90.0) & (np.abs(lons_arr) <= 180.0)
+            return mask.tolist()
+        return [self.validate_coordinates(lat, lon) for lat, lon in zip(lats, lons)]
+
+    def format_coordinates_batch(self, coords: List[Tuple[float, float]]) -> List[str]:
+        """
+        Format many (lat, lon) pairs, vectorizing the DMS math when possible.
+
+        Args:
+            coords: List of (latitude, longitude) tuples
+
+        Returns:
+            List of formatted coordinate strings
+        """
+        if not (NUMPY_AVAILABLE and coords):
+            return [self.format_coordinates(lat, lon) for lat, lon in coords]
+
+        lats = np.array([c[0] for c in coords], dtype=np.float64)
+        lons = np.array([c[1] for c in coords], dtype=np.float64)
+
+        lat_dirs = np.where(lats >= 0, 'N', 'S')
+        lon_dirs = np.where(lons >= 0, 'E', 'W')
+
+        def dms(values):
+            values_abs = np.abs(values)
+            degrees = values_abs.astype(np.int64)
+            minutes_full = (values_abs - degrees) * 60
+            minutes = minutes_full.astype(np.int64)
+            seconds = np.round((minutes_full - minutes) * 60, 2)
+            return degrees, minutes, seconds
+
+        lat_deg, lat_min, lat_sec = dms(lats)
+        lon_deg, lon_min, lon_sec = dms(lons)
+
+        return [
+            f"{lat_deg[i]}°{lat_min[i]}'{lat_sec[i]}\"{lat_dirs[i]}, "
+            f"{lon_deg[i]}°{lon_min[i]}'{lon_sec[i]}\"{lon_dirs[i]}"
+            for i in range(len(coords))
+        ]
+
     def format_coordinates(self, lat: float, lon: float) -> str:
         """Format coordinates in readable format."""
         lat_dir = "N" if lat >= 0 else "S"
@@ -507,10 +849,11 @@ class LocationManager:
         Returns:
             Tuple of (min_lat, max_lat, min_lon, max_lon)
         """
-        # Approximate conversion: 1 degree ≈ 111 km
+        # Approximate conversion: 1 degree ≈ 111 km. Longitude degrees shrink
+        # with cos(latitude); clamp the factor so the box stays finite at the poles.
         lat_range = radius_km / 111.0
-        lon_range = radius_km / (111.0 * abs(center_lat) / 90.0)  # Adjust for latitude
-        
+        lon_range = radius_km / (111.320 * max(math.cos(math.radians(center_lat)), 1e-6))
+
         min_lat = center_lat - lat_range
         max_lat = center_lat + lat_range
         min_lon = center_lon - lon_range
@@ -529,7 +872,7 @@ class LocationManager:
                 "exported_at": datetime.now().isoformat(),
                 "facility_type": facility_type or "all",
                 "total_locations": len(locations_to_export),
-                "locations": [asdict(loc) for loc in locations_to_export]
+                "locations": [_location_to_dict(loc) for loc in locations_to_export]
             }
             
             with open(export_path, 'w', encoding='utf-8') as f:
@@ -551,8 +894,21 @@ class LocationManager:
             for loc_data in data.get('locations', []):
                 location = Location(**loc_data)
                 imported_locations.append(location)
-            
+
+            # Validate every imported coordinate pair in one vectorized pass
+            # and drop out-of-range rows before they reach the index or disk
+            validity = self.validate_coordinates_batch(
+                [loc.latitude for loc in imported_locations],
+                [loc.longitude for loc in imported_locations]
+            )
+            invalid_count = validity.count(False)
+            if invalid_count:
+                self.logger.warning(
+                    f"Skipping {invalid_count} imported locations with out-of-range coordinates")
+                imported_locations = [loc for loc, ok in zip(imported_locations, validity) if ok]
+
             self.locations.extend(imported_locations)
+            self._rebuild_index()
             self._save_locations()
             
             self.logger.info(f"Imported {len(imported_locations)} locations from {import_path}")
@@ -581,12 +937,38 @@ class LocationManager:
             }
         }
         
+        if NUMPY_AVAILABLE and self._lats is not None:
+            # Single vectorized pass over the SoA columns
+            stats["active_locations"] = int(self._active_mask.sum())
+
+            types, counts = np.unique(self._types, return_counts=True)
+            stats["by_type"] = {t: int(c) for t, c in zip(types.tolist(), counts.tolist())}
+
+            # Bin 0 holds locations without a capacity and is dropped
+            bins = np.digitize(self._capacities, [1, 100, 500, 1000])
+            bin_counts = np.bincount(bins, minlength=5)
+            stats["by_capacity"]["small"] = int(bin_counts[1])
+            stats["by_capacity"]["medium"] = int(bin_counts[2])
+            stats["by_capacity"]["large"] = int(bin_counts[3])
+            stats["by_capacity"]["xlarge"] = int(bin_counts[4])
+
+            lats, lons = self._lats, self._lons
+            na = (lats >= 25) & (lats <= 50) & (lons >= -125) & (lons <= -65)
+            eu = ~na & (lats >= 35) & (lats <= 70) & (lons >= -10) & (lons <= 40)
+            asia = ~na & ~eu & (lats >= 10) & (lats <= 60) & (lons >= 60) & (lons <= 150)
+            stats["geographic_coverage"]["north_america"] = int(na.sum())
+            stats["geographic_coverage"]["europe"] = int(eu.sum())
+            stats["geographic_coverage"]["asia"] = int(asia.sum())
+            stats["geographic_coverage"]["other"] = len(self.locations) - int(
+                na.sum() + eu.sum() + asia.sum())
+            return stats
+
         # Count by type
         for location in self.locations:
             if location.type not in stats["by_type"]:
                 stats["by_type"][location.type] = 0
             stats["by_type"][location.type] += 1
-        
+
         # Count by capacity
         for location in self.locations:
             if location.capacity:
@@ -598,7 +980,7 @@ class LocationManager:
                     stats["by_capacity"]["large"] += 1
                 else:
                     stats["by_capacity"]["xlarge"] += 1
-        
+
         # Geographic coverage (simplified)
         for location in self.locations:
             if 25 <= location.latitude <= 50 and -125 <= location.longitude <= -65:
@@ -609,9 +991,25 @@ class LocationManager:
                 stats["geographic_coverage"]["asia"] += 1
             else:
                 stats["geographic_coverage"]["other"] += 1
-        
+
         return stats
 
 
-# Global location manager instance
-location_manager = LocationManager()
+# Global location manager instance, created lazily so importing this module
+# does not parse the locations file until the manager is actually used.
+_manager_instance: Optional[LocationManager] = None
+
+
+def get_location_manager() -> LocationManager:
+    """Get the shared location manager, creating it on first use."""
+    global _manager_instance
+    if _manager_instance is None:
+        _manager_instance = LocationManager()
+    return _manager_instance
+
+
+def __getattr__(name: str):
+    """Keep `from geolocation import location_manager` working lazily."""
+    if name == 'location_manager':
+        return get_location_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,149 +8,143 @@ Demonstrates the new CLI functionality including:
 - Nearby emergency contacts with geopy
 """
 
+import json
+import os
 import subprocess
 import sys
 from pathlib import Path
 
+# Resolved once; every path below reuses the same constant
+_HERE = Path(__file__).resolve().parent
 
-def run_cli_command(command):
-    """Run a CLI command and return the result."""
+# Compile bytecode for the heavy modules once, so the worker process below
+# loads cached .pyc files instead of re-parsing source
+subprocess.run(
+    [sys.executable, '-m', 'compileall', '-q', 'cli.py', 'database.py', 'geolocation.py'],
+    cwd=_HERE,
+    check=False
+)
+
+from click.testing import CliRunner
+
+# One persistent worker imports the CLI once and runs every command over a
+# line-delimited stdin/stdout protocol, instead of a fresh interpreter
+# (start-up + Click/Rich imports) per command
+_WORKER_PATH = _HERE / 'cli_worker.py'
+
+runner = CliRunner()
+
+# All CLI checks as (section header, success message, failure label, argv).
+# The header is printed before the first check of each section.
+CLI_CHECKS = [
+    ("1. Testing Quick Access Menu...",
+     "Quick access menu working", "Quick access failed",
+     ("quick",)),
+
+    ("\n2. Testing Emergency Resources...",
+     "Resources list command working", "Resources list failed",
+     ("resources", "list")),
+    (None,
+     "Resource add command working", "Resource add failed",
+     ("resources", "add",
+      "--name", "Test Generator", "--type", "equipment",
+      "--location", "Warehouse", "--capacity", "2000W")),
+
+    ("\n3. Testing Supply Checklists...",
+     "Supplies checklist command working", "Supplies checklist failed",
+     ("supplies", "checklist")),
+    (None,
+     "Supplies category filter working", "Supplies category filter failed",
+     ("supplies", "checklist", "--category", "medical_supplies")),
+    (None,
+     "Supplies priority filter working", "Supplies priority filter failed",
+     ("supplies", "checklist", "--priority", "critical")),
+
+    ("\n4. Testing Emergency Contacts...",
+     "Contacts list command working", "Contacts list failed",
+     ("contacts", "list")),
+    (None,
+     "Contacts type filter working", "Contacts type filter failed",
+     ("contacts", "list", "--type", "emergency")),
+
+    ("\n5. Testing Nearby Contacts...",
+     "Nearby contacts with coordinates working", "Nearby contacts with coordinates failed",
+     ("contacts", "nearby",
+      "--latitude", "40.7128", "--longitude", "-74.0060", "--radius", "5")),
+
+    ("\n6. Testing System Status...",
+     "Status command working", "Status command failed",
+     ("status",)),
+
+    ("\n7. Testing Help Commands...",
+     "Main help command working", "Main help command failed",
+     ("--help",)),
+    (None,
+     "Resources help command working", "Resources help command failed",
+     ("resources", "--help")),
+    (None,
+     "Supplies help command working", "Supplies help command failed",
+     ("supplies", "--help")),
+    (None,
+     "Contacts help command working", "Contacts help command failed",
+     ("contacts", "--help")),
+]
+
+
+def run_cli_command(worker, args_list):
+    """Send one command to the worker and read back its reply."""
     try:
-        result = subprocess.run(
-            command.split(),
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent
-        )
-        return result.returncode, result.stdout, result.stderr
+        worker.stdin.write(json.dumps(list(args_list)) + '\n')
+        worker.stdin.flush()
+        reply = worker.stdout.readline()
+        if not reply:
+            return -1, "", "worker exited unexpectedly"
+        exit_code, output = json.loads(reply)
+        return exit_code, output, ''
     except Exception as e:
         return -1, "", str(e)
 
 
-def test_cli_features():
-    """Test all the new CLI features."""
+def test_cli_features(fail_fast=True):
+    """
+    Test all the new CLI features.
+
+    With fail_fast set, the sweep stops at the first failing command so a
+    broken build does not pay for the remaining checks.
+    """
     print("🚨 Testing Disaster Response CLI Features\n")
-    
-    # Test 1: Quick access menu
-    print("1. Testing Quick Access Menu...")
-    return_code, output, error = run_cli_command("python cli.py quick")
-    if return_code == 0:
-        print("   ✓ Quick access menu working")
-    else:
-        print(f"   ✗ Quick access failed: {error}")
-    
-    # Test 2: Emergency Resources
-    print("\n2. Testing Emergency Resources...")
-    
-    # List resources
-    return_code, output, error = run_cli_command("python cli.py resources list")
-    if return_code == 0:
-        print("   ✓ Resources list command working")
-    else:
-        print(f"   ✗ Resources list failed: {error}")
-    
-    # Add a resource
-    return_code, output, error = run_cli_command(
-        'python cli.py resources add --name "Test Generator" --type equipment --location "Warehouse" --capacity "2000W"'
-    )
-    if return_code == 0:
-        print("   ✓ Resource add command working")
-    else:
-        print(f"   ✗ Resource add failed: {error}")
-    
-    # Test 3: Supply Checklists
-    print("\n3. Testing Supply Checklists...")
-    
-    # Show all supplies
-    return_code, output, error = run_cli_command("python cli.py supplies checklist")
-    if return_code == 0:
-        print("   ✓ Supplies checklist command working")
-    else:
-        print(f"   ✗ Supplies checklist failed: {error}")
-    
-    # Filter by category
-    return_code, output, error = run_cli_command("python cli.py supplies checklist --category medical_supplies")
-    if return_code == 0:
-        print("   ✓ Supplies category filter working")
-    else:
-        print(f"   ✗ Supplies category filter failed: {error}")
-    
-    # Filter by priority
-    return_code, output, error = run_cli_command("python cli.py supplies checklist --priority critical")
-    if return_code == 0:
-        print("   ✓ Supplies priority filter working")
-    else:
-        print(f"   ✗ Supplies priority filter failed: {error}")
-    
-    # Test 4: Emergency Contacts
-    print("\n4. Testing Emergency Contacts...")
-    
-    # List contacts
-    return_code, output, error = run_cli_command("python cli.py contacts list")
-    if return_code == 0:
-        print("   ✓ Contacts list command working")
-    else:
-        print(f"   ✗ Contacts list failed: {error}")
-    
-    # Filter contacts by type
-    return_code, output, error = run_cli_command("python cli.py contacts list --type emergency")
-    if return_code == 0:
-        print("   ✓ Contacts type filter working")
-    else:
-        print(f"   ✗ Contacts type filter failed: {error}")
-    
-    # Test 5: Nearby Contacts (with coordinates)
-    print("\n5. Testing Nearby Contacts...")
-    
-    # Test with coordinates (New York City area)
-    return_code, output, error = run_cli_command(
-        "python cli.py contacts nearby --latitude 40.7128 --longitude -74.0060 --radius 5"
-    )
-    if return_code == 0:
-        print("   ✓ Nearby contacts with coordinates working")
-    else:
-        print(f"   ✗ Nearby contacts with coordinates failed: {error}")
-    
-    # Test 6: System Status
-    print("\n6. Testing System Status...")
-    
-    return_code, output, error = run_cli_command("python cli.py status")
-    if return_code == 0:
-        print("   ✓ Status command working")
-    else:
-        print(f"   ✗ Status command failed: {error}")
-    
-    # Test 7: Help Commands
-    print("\n7. Testing Help Commands...")
-    
-    # Main help
-    return_code, output, error = run_cli_command("python cli.py --help")
-    if return_code == 0:
-        print("   ✓ Main help command working")
-    else:
-        print(f"   ✗ Main help command failed: {error}")
-    
-    # Resources help
-    return_code, output, error = run_cli_command("python cli.py resources --help")
-    if return_code == 0:
-        print("   ✓ Resources help command working")
-    else:
-        print(f"   ✗ Resources help command failed: {error}")
-    
-    # Supplies help
-    return_code, output, error = run_cli_command("python cli.py supplies --help")
-    if return_code == 0:
-        print("   ✓ Supplies help command working")
-    else:
-        print(f"   ✗ Supplies help command failed: {error}")
-    
-    # Contacts help
-    return_code, output, error = run_cli_command("python cli.py contacts --help")
-    if return_code == 0:
-        print("   ✓ Contacts help command working")
-    else:
-        print(f"   ✗ Contacts help command failed: {error}")
-    
+
+    # Run everything in a throwaway directory against a shared in-memory
+    # database, so the write checks never touch the real data files
+    with runner.isolated_filesystem():
+        os.environ['DISASTER_DB_URL'] = 'file:memdb_cli_tests?mode=memory&cache=shared'
+        worker = subprocess.Popen(
+            [sys.executable, '-u', str(_WORKER_PATH)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True
+        )
+        try:
+            for index, (section, ok_msg, fail_msg, argv) in enumerate(CLI_CHECKS):
+                if section:
+                    print(section)
+                return_code, output, error = run_cli_command(worker, argv)
+                if return_code == 0:
+                    print(f"   ✓ {ok_msg}")
+                else:
+                    print(f"   ✗ {fail_msg}: {error}")
+                    if fail_fast:
+                        remaining = len(CLI_CHECKS) - index - 1
+                        print(f"\n⏭  Fail-fast: skipping {remaining} remaining checks")
+                        break
+        finally:
+            os.environ.pop('DISASTER_DB_URL', None)
+            worker.stdin.close()
+            try:
+                worker.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                worker.terminate()
+
     print("\n✅ CLI feature testing completed!")
     print("\n[bold]Available Commands:[/bold]")
     print("  python cli.py quick                    - Quick access menu")
@@ -9,9 +9,124 @@ Demonstrates the enhanced geolocation functionality including:
 - Address geocoding capabilities
 """
 
-from geolocation import location_manager, Location
+from geolocation import location_manager, Location, EARTH_RADIUS_KM
+import json
 import math
 
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+    pytest = None
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+
+def haversine_vec(lat0, lon0, lats, lons):
+    """Vectorized haversine distances (km) from one point to many points."""
+    lat0, lon0 = np.radians(lat0), np.radians(lon0)
+    lats = np.radians(np.asarray(lats, dtype=float))
+    lons = np.radians(np.asarray(lons, dtype=float))
+    a = (np.sin((lats - lat0) / 2) ** 2
+         + np.cos(lat0) * np.cos(lats) * np.sin((lons - lon0) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+if PYTEST_AVAILABLE:
+    # Under pytest the numbered phases become parametrized cases against
+    # the session-scoped fixtures from conftest.py, so the manager's
+    # location load happens once and failures are reported per phase.
+
+    def test_location_statistics(stats):
+        assert stats['total_locations'] > 0
+        assert stats['active_locations'] <= stats['total_locations']
+        # by_type counts every location, active or not
+        assert sum(stats['by_type'].values()) == stats['total_locations']
+
+    @pytest.mark.parametrize('lat, lon, expected', [
+        (40.7128, -74.0060, True),
+        (0, 0, True),
+        (90, 180, True),
+        (91, 0, False),
+        (0, 181, False),
+        (-91, -181, False),
+    ])
+    def test_coordinate_validation(lm, lat, lon, expected):
+        assert lm.validate_coordinates(lat, lon) == expected
+
+    @pytest.mark.parametrize('name, lat, lon, expected_km', [
+        ("Bellevue Hospital", 40.7411, -73.9747, 4.1),
+        ("Brooklyn Shelter", 40.6944, -73.9861, 2.6),
+        ("UCLA Medical Center", 34.0664, -118.4450, 3952.0),
+        ("Chicago Hospital", 41.8947, -87.6225, 1143.8),
+    ])
+    def test_distance_calculations(lm, nyc, name, lat, lon, expected_km):
+        # The expected values are spherical-haversine figures, so pin the
+        # haversine path; calculate_distance dispatches to geopy's WGS84
+        # geodesic when available, which differs by kilometers at range
+        distance = lm._haversine_distance(nyc[0], nyc[1], lat, lon)
+        assert abs(distance - expected_km) < 0.1
+
+    @pytest.mark.parametrize('location_type', ['hospital', 'shelter'])
+    def test_find_nearest_facility(lm, nyc, location_type):
+        result = lm.find_nearest_location(nyc[0], nyc[1], location_type)
+        assert result is not None
+        location, distance = result
+        assert location.type == location_type
+        assert distance >= 0
+
+    def test_find_within_radius(nyc_facilities_50km):
+        hospitals = nyc_facilities_50km['hospital']
+        assert all(distance <= 50 for _, distance in hospitals)
+        assert all(h.type == 'hospital' for h, _ in hospitals)
+
+    def test_emergency_facilities_buckets(lm, nyc_facilities_50km):
+        # Buckets use the singular emergency_types keys and only appear
+        # when they have hits, so assert membership rather than equality
+        assert set(nyc_facilities_50km) <= set(lm.emergency_types)
+        assert {'hospital', 'shelter'} <= set(nyc_facilities_50km)
+        for facilities in nyc_facilities_50km.values():
+            assert facilities
+            assert all(distance <= 50 for _, distance in facilities)
+
+    def test_streaming_load_large_locations_file(tmp_path):
+        # A file over the 4 MB threshold takes the ijson streaming branch
+        # when ijson is installed; whichever parser runs, lat/lon must come
+        # back as plain floats or the NumPy index build blows up
+        from geolocation import LocationManager, _STREAM_PARSE_THRESHOLD_BYTES
+        padding = 'x' * 512
+        rows = [{'id': f'BIG-{i}', 'name': f'Facility {i}', 'type': 'shelter',
+                 'latitude': 40.0 + (i % 90) * 0.01,
+                 'longitude': -74.0 + (i % 180) * 0.01,
+                 'description': padding}
+                for i in range(9000)]
+        data_path = tmp_path / 'locations.json'
+        data_path.write_text(json.dumps({'locations': rows}), encoding='utf-8')
+        assert data_path.stat().st_size > _STREAM_PARSE_THRESHOLD_BYTES
+
+        manager = LocationManager(str(data_path))
+        assert len(manager.locations) == len(rows)
+        assert all(isinstance(loc.latitude, float) and isinstance(loc.longitude, float)
+                   for loc in manager.locations)
+
+    def test_vectorized_distances_match_scalar(lm, nyc, coords_soa):
+        lats, lons = coords_soa
+        distances = haversine_vec(nyc[0], nyc[1], lats, lons)
+        scalar = [lm._haversine_distance(nyc[0], nyc[1], loc.latitude, loc.longitude)
+                  for loc in lm.locations]
+        assert max(abs(d - s) for d, s in zip(distances, scalar)) < 1e-6
+
+    def test_bounding_box_contains_center(lm, nyc):
+        min_lat, max_lat, min_lon, max_lon = lm.get_bounding_box(nyc[0], nyc[1], 25)
+        assert min_lat < nyc[0] < max_lat
+        assert min_lon < nyc[1] < max_lon
+
 
 def test_geolocation_features():
     """Test all the geolocation functionality."""
@@ -30,13 +145,23 @@ def test_geolocation_features():
     print("\n2. Coordinate Validation:")
     valid_coords = [(40.7128, -74.0060), (0, 0), (90, 180)]
     invalid_coords = [(91, 0), (0, 181), (-91, -181)]
-    
-    for lat, lon in valid_coords:
-        is_valid = location_manager.validate_coordinates(lat, lon)
-        print(f"   ({lat}, {lon}): {'✓ Valid' if is_valid else '✗ Invalid'}")
-    
-    for lat, lon in invalid_coords:
-        is_valid = location_manager.validate_coordinates(lat, lon)
+    all_coords = valid_coords + invalid_coords
+
+    if NUMPY_AVAILABLE:
+        # One boolean mask validates every pair at once; the scalar
+        # validator is kept only as a sanity cross-check on one of each
+        lats = np.array([lat for lat, _ in all_coords], dtype=float)
+        lons = np.array([lon for _, lon in all_coords], dtype=float)
+        mask = (np.abs(lats) <= 90) & (np.abs(lons) <= 180)
+        assert mask.tolist() == [True] * len(valid_coords) + [False] * len(invalid_coords)
+        assert (location_manager.validate_coordinates(*valid_coords[0]),
+                location_manager.validate_coordinates(*invalid_coords[0])) == (True, False)
+        results = mask.tolist()
+    else:
+        results = [location_manager.validate_coordinates(lat, lon)
+                   for lat, lon in all_coords]
+
+    for (lat, lon), is_valid in zip(all_coords, results):
         print(f"   ({lat}, {lon}): {'✓ Valid' if is_valid else '✗ Invalid'}")
     
     # Test 3: Test distance calculations
@@ -52,8 +177,20 @@ def test_geolocation_features():
         ("Chicago Hospital", 41.8947, -87.6225)
     ]
     
-    for name, lat, lon in test_locations:
-        distance = location_manager.calculate_distance(nyc_lat, nyc_lon, lat, lon)
+    if NUMPY_AVAILABLE:
+        # One broadcast computes every distance, cross-checked against the
+        # manager's scalar haversine path
+        distances = haversine_vec(nyc_lat, nyc_lon,
+                                  [lat for _, lat, _ in test_locations],
+                                  [lon for _, _, lon in test_locations])
+        scalar = [location_manager._haversine_distance(nyc_lat, nyc_lon, lat, lon)
+                  for _, lat, lon in test_locations]
+        assert max(abs(d - s) for d, s in zip(distances, scalar)) < 1e-6
+    else:
+        distances = [location_manager.calculate_distance(nyc_lat, nyc_lon, lat, lon)
+                     for _, lat, lon in test_locations]
+
+    for (name, _, _), distance in zip(test_locations, distances):
         print(f"   NYC to {name}: {distance:.1f} km")
     
     # Test 4: Find nearest facilities
@@ -105,8 +242,12 @@ def test_geolocation_features():
         (25.7617, -80.1918)   # Miami
     ]
     
-    for lat, lon in test_coords:
-        formatted = location_manager.format_coordinates(lat, lon)
+    # One batch call formats all pairs; cross-checked against the scalar
+    # formatter so both paths stay in agreement
+    formatted_batch = location_manager.format_coordinates_batch(test_coords)
+    assert formatted_batch == [location_manager.format_coordinates(lat, lon)
+                               for lat, lon in test_coords]
+    for (lat, lon), formatted in zip(test_coords, formatted_batch):
         print(f"   ({lat}, {lon}) → {formatted}")
     
     # Test 8: Test bounding box calculations
@@ -138,6 +279,7 @@ def test_geolocation_features():
     print("\n10. Adding New Location:")
     
     new_location = Location(
+        id="",
         name="Test Emergency Center",
         type="aid_station",
         address="123 Test Street, Test City, TC 12345",
@@ -147,16 +289,12 @@ def test_geolocation_features():
         contact_phone="555-0123",
         description="Test emergency facility for demonstration"
     )
-    
-    if location_manager.add_location(new_location):
+
+    # add_location returns the stored object, so no by-id re-scan is needed
+    stored = location_manager.add_location(new_location)
+    if stored:
         print("   ✓ Test location added successfully")
-        
-        # Verify it was added
-        added_location = location_manager.get_location_by_id(new_location.id)
-        if added_location:
-            print(f"   ✓ Location retrieved: {added_location.name}")
-        else:
-            print("   ✗ Failed to retrieve added location")
+        print(f"   ✓ Location stored: {stored.name} ({stored.id})")
     else:
         print("   ✗ Failed to add test location")
     
@@ -168,5 +306,9 @@ def test_geolocation_features():
     print("  python cli.py facilities list --type hospital")
 
 
+if PYTEST_AVAILABLE:
+    test_geolocation_features.__test__ = False
+
+
 if __name__ == '__main__':
     test_geolocation_features()